@@ -113,12 +113,14 @@ node.querySelector(".card__format").textContent = format || "";
 function updateSyncLabel(iso) {
   if (!ui.syncLabel) return;
   const dt = new Date(iso);
-  ui.syncLabel.textContent = `Last sync: ${Number.isNaN(dt.getTime()) ? "unknown" : dt.toLocaleString()}`;
+  ui.syncLabel.textContent = `Last changed: ${Number.isNaN(dt.getTime()) ? "unknown" : dt.toLocaleString()}`;
 }
 
+// syncedAt only moves when the feed's events change, so freshness is measured from
+// when this browser last fetched it.
 function cacheIsFresh(cache) {
-  if (!cache?.syncedAt || !Array.isArray(cache.events)) return false;
-  return Date.now() - new Date(cache.syncedAt).getTime() < CACHE_TTL_MS;
+  if (!cache?.fetchedAt || !Array.isArray(cache.events)) return false;
+  return Date.now() - new Date(cache.fetchedAt).getTime() < CACHE_TTL_MS;
 }
 
 async function fetchPublishedEvents() {
@@ -134,9 +136,11 @@ async function fetchPublishedEvents() {
     throw new Error("Invalid events.json payload (missing events array)");
   }
 
+  const fetchedAt = new Date().toISOString();
   return {
     events: payload.events,
-    syncedAt: payload.syncedAt || new Date().toISOString(),
+    syncedAt: payload.syncedAt || fetchedAt,
+    fetchedAt,
   };
 }
 
@@ -158,7 +162,7 @@ async function loadEvents({ force = false } = {}) {
     safeSetText(ui.statusMessage, "Loaded events from daily published feed.");
   } catch (err) {
     const syncedAt = new Date().toISOString();
-    const fallbackPayload = { events: FALLBACK_EVENTS, syncedAt };
+    const fallbackPayload = { events: FALLBACK_EVENTS, syncedAt, fetchedAt: syncedAt };
     appState.allEvents = FALLBACK_EVENTS;
     writeStorage(CACHE_KEY, fallbackPayload);
     updateSyncLabel(syncedAt);
@@ -14,15 +14,64 @@ Standard library only (no external deps).
 
 from __future__ import annotations
 
+import copy
+import gzip
+import hashlib
 import html
+import http.client
 import json
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable
-from urllib.error import HTTPError, URLError
-from urllib.parse import urljoin
-from urllib.request import Request, urlopen
+from typing import Any, Callable, Iterable
+from urllib.parse import urljoin, urlsplit
+
+
+# ----------------------------
+# Compiled patterns
+# ----------------------------
+
+_RE_SCRIPT_STYLE = re.compile(r"<(script|style)\b[^>]*>.*?</\1>", re.I | re.S)
+_RE_LINE_BREAK = re.compile(
+    r"</(?:p|div|li|h1|h2|h3|h4|tr|td|th|section|article|header|footer)\s*>|<br\s*/?>",
+    re.I,
+)
+_RE_TAG = re.compile(r"<[^>]+>")
+
+_RE_SLUG_NONALNUM = re.compile(r"[^a-z0-9]+")
+_RE_SECTION_SPLIT = re.compile(r"\s*[;,•]\s*|\s+\|\s+")
+
+# optional leading weekday ("Saturday, ") then "March 14, 2026"
+_RE_USCHESS_DATE = re.compile(r"^(?:[A-Za-z]+,\s*)?([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})$")
+_RE_H3_A = re.compile(
+    r"<h3[^>]*>\s*<a[^>]*href=\"([^\"]+)\"[^>]*>(.*?)</a>\s*</h3>",
+    re.I | re.S,
+)
+_RE_PAGER_PAGE = re.compile(r"(?:\?|&(?:amp;)?)page=(\d+)")
+_RE_CITY_STATE = re.compile(r"\b([A-Za-z .'-]+),\s*([A-Z]{2})\b")
+_RE_ADDRESSY = re.compile(r"\d{2,}|\bUnited States\b|\b\d{5}\b")
+
+_RE_MICHESS_DETAIL = re.compile(
+    r'href=["\'](?P<rel>/event-details/[^"\']+)["\']'
+    r'|href=["\'](?P<abs>https?://www\.michess\.org/event-details/[^"\']+)["\']'
+    r"|(?P<path>/event-details/[a-z0-9\-]+-\d+)",
+    re.I,
+)
+_RE_SITEMAP_LOC = re.compile(
+    r"<loc>\s*(https?://www\.michess\.org/event-details/[^<\s]+)\s*</loc>", re.I
+)
+_RE_YEAR = re.compile(r"\b(20\d{2})\b")
+# matched per line of newline-joined, whitespace-collapsed lines, hence " *" over "\s*"
+_RE_MICHESS_DATE = re.compile(
+    r"^[A-Za-z]{3}, *([A-Za-z]{3}) *(\d{1,2}) *- *[A-Za-z]{3}, *([A-Za-z]{3}) *(\d{1,2})$",
+    re.M,
+)
+_RE_OG_TITLE = re.compile(r'property=["\']og:title["\']\s+content=["\']([^"\']+)["\']', re.I)
+_RE_TITLE = re.compile(r"<title>\s*(.*?)\s*</title>", re.I | re.S)
+_RE_TITLE_SUFFIX = re.compile(r"\s+\|\s+")
+_RE_H1 = re.compile(r"<h1[^>]*>\s*(.*?)\s*</h1>", re.I | re.S)
 
 
 # ----------------------------
@@ -32,6 +81,7 @@ from urllib.request import Request, urlopen
 HERE = Path(__file__).resolve()
 ROOT = HERE.parents[1] if HERE.parent.name == "scripts" else HERE.parent
 OUTPUT_PATH = ROOT / "events.json"
+PARSE_CACHE_PATH = ROOT / ".parse_cache.json"
 
 
 # ----------------------------
@@ -63,47 +113,136 @@ SOURCE_CATALOG: list[dict[str, Any]] = [
 
 DEFAULT_TIMEOUT_SECS = 30
 USER_AGENT = "Mozilla/5.0 (compatible; TournamentRadarBot/1.0)"
+REQUEST_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Encoding": "gzip",
+}
+MAX_REDIRECTS = 5
+MAX_FETCH_WORKERS = 16
+USCHESS_MAX_PAGES = 120
+USCHESS_PAGE_BATCH = 8
+
+# One keep-alive connection per (thread, scheme, host), so worker threads
+# never share a socket and repeated fetches skip the TCP+TLS handshake.
+_http_local = threading.local()
+
+def _get_connection(scheme: str, host: str) -> tuple[http.client.HTTPConnection, bool]:
+    conns = getattr(_http_local, "conns", None)
+    if conns is None:
+        conns = _http_local.conns = {}
+    conn = conns.get((scheme, host))
+    if conn is not None:
+        return conn, True
+    if scheme == "https":
+        conn = http.client.HTTPSConnection(host, timeout=DEFAULT_TIMEOUT_SECS)
+    else:
+        conn = http.client.HTTPConnection(host, timeout=DEFAULT_TIMEOUT_SECS)
+    conns[(scheme, host)] = conn
+    return conn, False
+
+def _drop_connection(scheme: str, host: str) -> None:
+    conn = _http_local.conns.pop((scheme, host), None)
+    if conn is not None:
+        conn.close()
+
+class FetchError(RuntimeError):
+    """A failed fetch; status is the HTTP status when the server answered with one."""
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+def _get(url: str, headers: dict[str, str]) -> tuple[http.client.HTTPResponse, bytes]:
+    """
+    Single GET over the pooled connection; returns the (already read) response and its body.
+    A reused connection the server already closed is retried once on a fresh one.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        raise ValueError(f"unsupported URL scheme: {url}")
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    while True:
+        conn, reused = _get_connection(parts.scheme, parts.netloc)
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            raw = resp.read()
+        except (OSError, http.client.HTTPException):
+            _drop_connection(parts.scheme, parts.netloc)
+            if reused:
+                continue
+            raise
+        if resp.will_close:
+            _drop_connection(parts.scheme, parts.netloc)
+        return resp, raw
+
+def fetch_conditional(url: str, validators: dict[str, str] | None = None) -> tuple[str | None, dict[str, str]]:
+    """
+    GET with If-None-Match / If-Modified-Since built from validators (a previous response's
+    ETag / Last-Modified). Returns (None, validators) on 304, else (body, fresh validators).
+    """
+    headers = dict(REQUEST_HEADERS)
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("lastModified"):
+            headers["If-Modified-Since"] = validators["lastModified"]
+    try:
+        for _ in range(MAX_REDIRECTS + 1):
+            resp, raw = _get(url, headers)
+            location = resp.getheader("Location")
+            if resp.status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                continue
+            if resp.status == 304 and validators:
+                return None, validators
+            if resp.status >= 400:
+                raise FetchError(f"Fetch failed for {url}: HTTP Error {resp.status}: {resp.reason}", resp.status)
+            fresh = {}
+            if resp.getheader("ETag"):
+                fresh["etag"] = resp.getheader("ETag")
+            if resp.getheader("Last-Modified"):
+                fresh["lastModified"] = resp.getheader("Last-Modified")
+            if (resp.getheader("Content-Encoding") or "").lower() == "gzip":
+                raw = gzip.decompress(raw)
+            return raw.decode("utf-8", errors="replace"), fresh
+        raise FetchError(f"Fetch failed for {url}: too many redirects")
+    except (OSError, http.client.HTTPException, ValueError) as e:
+        raise FetchError(f"Fetch failed for {url}: {e}") from e
 
 def fetch_text(url: str) -> str:
-    req = Request(
-        url,
-        headers={
-            "User-Agent": USER_AGENT,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        },
-    )
-    try:
-        with urlopen(req, timeout=DEFAULT_TIMEOUT_SECS) as resp:
-            raw = resp.read()
-            try:
-                return raw.decode("utf-8", errors="replace")
-            except Exception:
-                return raw.decode(errors="replace")
-    except (HTTPError, URLError) as e:
-        raise RuntimeError(f"Fetch failed for {url}: {e}") from e
+    text, _ = fetch_conditional(url)
+    return text or ""
 
 
 # ----------------------------
 # Generic helpers
 # ----------------------------
 
+# Sources run on their own threads; print() writes the text and the newline
+# separately, so serialize whole lines or CI logs interleave them.
+_log_lock = threading.Lock()
+
+def log(message: str) -> None:
+    with _log_lock:
+        print(message, flush=True)
+
+
 def _strip_html_to_lines(markup: str) -> list[str]:
-    markup = re.sub(r"<script\b[^>]*>.*?</script>", " ", markup, flags=re.I | re.S)
-    markup = re.sub(r"<style\b[^>]*>.*?</style>", " ", markup, flags=re.I | re.S)
-    markup = re.sub(
-        r"</(p|div|li|h1|h2|h3|h4|tr|td|th|section|article|header|footer)\s*>",
-        "\n",
-        markup,
-        flags=re.I,
-    )
-    markup = re.sub(r"<br\s*/?>", "\n", markup, flags=re.I)
+    markup = _RE_SCRIPT_STYLE.sub(" ", markup)
+    markup = _RE_LINE_BREAK.sub("\n", markup)
 
-    text = re.sub(r"<[^>]+>", " ", markup)
+    text = _RE_TAG.sub(" ", markup)
     text = html.unescape(text)
 
     lines: list[str] = []
     for raw in text.splitlines():
-        line = re.sub(r"\s+", " ", raw).strip()
+        # str.split() splits on the same whitespace as \s+ and drops the ends
+        line = " ".join(raw.split())
         if line:
             lines.append(line)
     return lines
@@ -111,16 +250,20 @@ def _strip_html_to_lines(markup: str) -> list[str]:
 
 def sanitize_slug(value: str) -> str:
     value = value.lower().strip()
-    value = re.sub(r"[^a-z0-9]+", "-", value)
-    value = re.sub(r"-+", "-", value).strip("-")
+    # each non-alphanumeric run becomes a single "-", so no dash runs are left to squeeze
+    value = _RE_SLUG_NONALNUM.sub("-", value).strip("-")
     return value[:80] if value else "event"
 
 
+def event_key(e: dict[str, Any]) -> tuple[Any, ...]:
+    return (e.get("name", ""), e.get("startDate", ""), e.get("city", ""), e.get("state", ""))
+
+
 def dedupe(events: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
-    seen: set[str] = set()
+    seen: set[tuple[Any, ...]] = set()
     out: list[dict[str, Any]] = []
     for e in events:
-        key = f"{e.get('name','')}|{e.get('startDate','')}|{e.get('city','')}|{e.get('state','')}"
+        key = event_key(e)
         if key in seen:
             continue
         seen.add(key)
@@ -128,36 +271,62 @@ def dedupe(events: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
     return out
 
 
-def is_upcoming(event: dict[str, Any]) -> bool:
-    today = date.today().isoformat()
+def read_published_events(path: Path = OUTPUT_PATH) -> list[dict[str, Any]]:
+    """
+    Events from the last published feed ([] if missing or unreadable).
+    """
+    try:
+        with path.open(encoding="utf-8") as fp:
+            payload = json.load(fp)
+    except (OSError, ValueError):
+        return []
+    events = payload.get("events") if isinstance(payload, dict) else None
+    if not isinstance(events, list):
+        return []
+    return [e for e in events if isinstance(e, dict)]
+
+
+def is_upcoming(event: dict[str, Any], today: str) -> bool:
     end_date = str(event.get("endDate") or "")
     return bool(end_date) and end_date >= today
 
 
-def _grab_value_after_label(lines: list[str], label: str) -> str:
+def _extract_labeled_values(lines: list[str], labels: tuple[str, ...]) -> dict[str, str]:
     """
-    Handles both 'Label:' and 'Label' forms, with the value on the next line.
+    Handles both 'Label:' and 'Label' forms (case-insensitive), with the value on the next line.
+    Walks the lines once for all labels; returns {label: value}, "" when not found.
     """
-    want = label.lower().strip().rstrip(":")
+    out = dict.fromkeys(labels, "")
+    pending: dict[str, list[str]] = {}
+    for label in labels:
+        pending.setdefault(label.lower().strip().rstrip(":"), []).append(label)
+
     for i, ln in enumerate(lines):
+        if not pending:
+            break
         cur = ln.strip().lower().rstrip(":")
-        if cur == want:
-            for j in range(i + 1, min(i + 20, len(lines))):
-                v = lines[j].strip()
-                if not v:
-                    continue
-                # stop if next label
-                if v.endswith(":") and len(v) <= 35:
-                    return ""
-                return v
-    return ""
+        keys = pending.get(cur)
+        if keys is None:
+            continue
+        for j in range(i + 1, min(i + 20, len(lines))):
+            v = lines[j].strip()
+            if not v:
+                continue
+            # stop if next label
+            if v.endswith(":") and len(v) <= 35:
+                v = ""
+            for k in keys:
+                out[k] = v
+            del pending[cur]
+            break
+    return out
 
 
 def _parse_sections(text: str) -> list[str]:
     if not text:
         return []
     # split on commas/semicolons/bullets
-    parts = re.split(r"\s*[;,•]\s*|\s+\|\s+", text)
+    parts = _RE_SECTION_SPLIT.split(text)
     parts = [p.strip() for p in parts if p.strip()]
     # don't return insane stuff
     out: list[str] = []
@@ -168,6 +337,89 @@ def _parse_sections(text: str) -> list[str]:
     return out
 
 
+# ----------------------------
+# Parse cache
+# ----------------------------
+
+PARSE_CACHE_VERSION = 3
+
+class PageCache:
+    """
+    url -> (validators, content hash, parse result) memo persisted between daily runs.
+    Pages are refetched conditionally; a 304 or an unchanged body reuses the stored result.
+    Only entries used during this run are written back, so dead URLs age out.
+    A parse that also depends on something other than the page (e.g. the current year)
+    passes it as `context`; an entry stored under a different context is a miss.
+    """
+
+    def __init__(self, path: Path | None = PARSE_CACHE_PATH) -> None:
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = self._load()
+        self.used: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        # sources are fetched concurrently, so parse() may run on several threads
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self.path is None:
+            return {}
+        try:
+            with self.path.open(encoding="utf-8") as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != PARSE_CACHE_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _entry(self, url: str, context: str | None) -> dict[str, Any] | None:
+        entry = self.entries.get(url)
+        return entry if entry and entry.get("context") == context else None
+
+    def fetch(self, url: str, context: str | None = None) -> tuple[str | None, dict[str, str]]:
+        """
+        Conditional GET for url; safe to call from worker threads. Pass the result to parse().
+        Unconditional when the stored entry has a different context, since it can't be reused.
+        """
+        entry = self._entry(url, context)
+        return fetch_conditional(url, entry.get("validators") if entry else None)
+
+    def parse(
+        self,
+        url: str,
+        fetched: tuple[str | None, dict[str, str]],
+        parse: Callable[[str], Any],
+        context: str | None = None,
+    ) -> Any:
+        page_text, validators = fetched
+        entry = self._entry(url, context)
+        hit = True
+        if page_text is None:
+            if entry is None:
+                raise RuntimeError(f"304 Not Modified for {url} with no cached result")
+            result = entry.get("result")
+        else:
+            digest = hashlib.blake2b(page_text.encode("utf-8"), digest_size=16).hexdigest()
+            if entry and entry.get("hash") == digest:
+                result = entry.get("result")
+            else:
+                hit = False
+                result = parse(page_text)
+            entry = {"validators": validators, "hash": digest, "context": context, "result": result}
+        with self._lock:
+            self.hits += hit
+            self.used[url] = entry
+        # callers mutate events (enrichment), so never hand out the cached objects
+        return copy.deepcopy(result)
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self.path.open("w", encoding="utf-8") as fp:
+            json.dump({"version": PARSE_CACHE_VERSION, "entries": self.used}, fp)
+
+
 # ----------------------------
 # US Chess parsing
 # ----------------------------
@@ -189,9 +441,7 @@ MONTHS = {
 }
 
 def _parse_us_chess_date_one(s: str):
-    s = s.strip()
-    s = re.sub(r"^[A-Za-z]+,\s*", "", s)  # remove weekday if present
-    m = re.match(r"^([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})$", s)
+    m = _RE_USCHESS_DATE.match(s.strip())
     if not m:
         return None
     mon = MONTHS.get(m.group(1).lower())
@@ -203,6 +453,9 @@ def _parse_us_chess_date_one(s: str):
         return None
 
 def _parse_us_chess_date_range(s: str):
+    # every date has a comma after the day; skip the regex for lines that can't match
+    if "," not in s:
+        return None
     s = s.strip()
     parts = [p.strip() for p in s.split(" - ")]
     if not parts:
@@ -215,11 +468,18 @@ def _parse_us_chess_date_range(s: str):
         end = start
     return (start.isoformat(), end.isoformat())
 
+def _is_state_code(s: str) -> bool:
+    # same as fullmatch("[A-Z]{2}"), without a regex call per listing line
+    return len(s) == 2 and s.isascii() and s.isalpha() and s.isupper()
+
 def _parse_location_flexible(loc: str):
+    # "City, ST" / "City, State" needs a comma; most probed lines have none
+    if "," not in loc:
+        return None
     parts = [p.strip() for p in loc.split(",") if p.strip()]
     if len(parts) == 2:
         city, s2 = parts
-        if re.fullmatch(r"[A-Z]{2}", s2):
+        if _is_state_code(s2):
             return city, s2
         abbr = US_STATE_ABBR.get(s2.lower())
         return (city, abbr) if abbr else None
@@ -227,24 +487,24 @@ def _parse_location_flexible(loc: str):
         city = parts[0]
         mid = parts[1]
         last = parts[-1]
-        if re.fullmatch(r"[A-Z]{2}", mid):
+        if _is_state_code(mid):
             return city, mid
         abbr = US_STATE_ABBR.get(last.lower())
         return (city, abbr) if abbr else None
     return None
 
+# Listing cards put title, dates, location and organizer up front; stripping the
+# first few KB of a block is enough for nearly all of them.
+USCHESS_SNIPPET_PREFIX_CHARS = 4096
+
 def _uschess_blocks(page_html: str, base_url: str) -> list[tuple[str, str, str]]:
     blocks: list[tuple[str, str, str]] = []
-    matches = list(re.finditer(
-        r"<h3[^>]*>\s*<a[^>]*href=\"([^\"]+)\"[^>]*>(.*?)</a>\s*</h3>",
-        page_html,
-        flags=re.I | re.S,
-    ))
+    matches = list(_RE_H3_A.finditer(page_html))
     for idx, m in enumerate(matches):
         href = m.group(1)
         inner = m.group(2)
-        title = html.unescape(re.sub(r"<[^>]+>", " ", inner))
-        title = re.sub(r"\s+", " ", title).strip()
+        title = html.unescape(_RE_TAG.sub(" ", inner))
+        title = " ".join(title.split())
         if not title:
             continue
         event_url = urljoin(base_url, href)
@@ -255,39 +515,73 @@ def _uschess_blocks(page_html: str, base_url: str) -> list[tuple[str, str, str]]
         blocks.append((title, event_url, snippet))
     return blocks
 
-def parse_uschess_upcoming(page_html: str, source: dict[str, Any]) -> list[dict[str, Any]]:
-    out: list[dict[str, Any]] = []
-    blocks = _uschess_blocks(page_html, source["homepage"])
-    for title, event_url, snippet_html in blocks:
-        lines = _strip_html_to_lines(snippet_html)
-
-        loc = None
-        dr = None
-        organizer = ""
-
-        for ln in lines[:40]:
-            loc_try = _parse_location_flexible(ln)
-            if loc_try:
-                loc = loc_try
-                break
+def _uschess_last_page(page_html: str) -> int | None:
+    """
+    Highest ?page=N linked from the listing's pager (Drupal, zero-based), or None without a pager.
+    """
+    pages = [int(n) for n in _RE_PAGER_PAGE.findall(page_html)]
+    return max(pages) if pages else None
 
-        for ln in lines[:80]:
-            dr_try = _parse_us_chess_date_range(ln)
-            if dr_try:
-                dr = dr_try
+def _strip_snippet_prefix(snippet_html: str, limit: int) -> list[str] | None:
+    """
+    Lines of roughly the first `limit` chars of a block, cut at a tag boundary and
+    without the last line (the cut may split it). None when the block is short
+    anyway or the cut would land inside <script>/<style>.
+    """
+    if len(snippet_html) <= limit:
+        return None
+    cut = snippet_html.rfind("<", 0, limit)
+    if cut <= 0:
+        return None
+    prefix = snippet_html[:cut]
+    low = prefix.lower()
+    if low.rfind("<script") > low.rfind("</script") or low.rfind("<style") > low.rfind("</style"):
+        return None
+    return _strip_html_to_lines(prefix)[:-1]
+
+def _scan_uschess_block(lines: list[str]) -> tuple[tuple[str, str], tuple[str, str], int] | None:
+    loc = None
+    dr = None
+
+    # One pass: location within the first 40 lines, date range within the first 80.
+    # Stop as soon as both are found, or once a location can no longer turn up.
+    date_idx = -1
+    for i, ln in enumerate(lines[:80]):
+        if loc is None:
+            if i >= 40:
                 break
+            loc = _parse_location_flexible(ln)
+        if dr is None:
+            dr = _parse_us_chess_date_range(ln)
+            date_idx = i
+        if loc is not None and dr is not None:
+            break
 
-        if dr:
-            for i, ln in enumerate(lines[:120]):
-                if _parse_us_chess_date_range(ln):
-                    for j in range(i + 1, min(i + 10, len(lines))):
-                        if lines[j].strip():
-                            organizer = lines[j].strip()
-                            break
-                    break
+    if not loc or not dr:
+        return None
+    return loc, dr, date_idx
 
-        if not loc or not dr:
+def parse_uschess_upcoming(page_html: str, source: dict[str, Any]) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    blocks = _uschess_blocks(page_html, source["homepage"])
+    for title, event_url, snippet_html in blocks:
+        # Try the block's prefix first; fall back to the whole block when the
+        # prefix doesn't hold the location, the dates and the organizer line.
+        scan = None
+        lines = _strip_snippet_prefix(snippet_html, USCHESS_SNIPPET_PREFIX_CHARS)
+        if lines is not None:
+            scan = _scan_uschess_block(lines)
+            if scan is not None and scan[2] + 1 >= len(lines):
+                scan = None
+        if scan is None:
+            lines = _strip_html_to_lines(snippet_html)
+            scan = _scan_uschess_block(lines)
+        if scan is None:
             continue
+        loc, dr, date_idx = scan
+
+        # Organizer is the line after the date line (lines are stripped and non-empty)
+        organizer = lines[date_idx + 1] if date_idx + 1 < len(lines) else ""
 
         city, state = loc
         startDate, endDate = dr
@@ -312,58 +606,48 @@ def parse_uschess_upcoming(page_html: str, source: dict[str, Any]) -> list[dict[
         })
     return out
 
-def enrich_uschess_event(event: dict[str, Any]) -> dict[str, Any]:
+# Fields filled in from the event detail page by enrich_uschess_event
+USCHESS_ENRICHED_FIELDS = ("venue", "timeControl", "entryFee", "sections", "description")
+
+def parse_uschess_event_detail(detail_html: str) -> dict[str, Any]:
     """
-    Fetch event detail page and parse key fields reliably from labels.
+    Parse key fields of an event detail page reliably from labels.
+    Returns the USCHESS_ENRICHED_FIELDS, empty where the page doesn't have them.
     """
-    url = event.get("sourceUrl", "")
-    if not url:
-        return event
-
-    try:
-        detail_html = fetch_text(url)
-    except Exception:
-        return event
-
     lines = _strip_html_to_lines(detail_html)
 
+    values = _extract_labeled_values(lines, ("Location", "Time Control", "Entry Fee", "Sections"))
+
     # Venue/location: look for a "Location" label and grab next line; fallback to addressy line with City, ST
-    venue = _grab_value_after_label(lines, "Location:")
-    if not venue:
-        venue = _grab_value_after_label(lines, "Location")
+    venue = values["Location"]
     if not venue:
         for ln in lines[:600]:
-            if re.search(r"\b[A-Za-z .'-]+,\s*[A-Z]{2}\b", ln) and re.search(r"\d{2,}|\b\d{5}\b|\bUnited States\b", ln):
-                venue = ln.strip()
+            if "," in ln and _RE_CITY_STATE.search(ln) and _RE_ADDRESSY.search(ln):
+                venue = ln
                 break
 
-    time_control = _grab_value_after_label(lines, "Time Control:")
-    if not time_control:
-        time_control = _grab_value_after_label(lines, "Time Control")
-
-    entry_fee = _grab_value_after_label(lines, "Entry Fee:")
-    if not entry_fee:
-        entry_fee = _grab_value_after_label(lines, "Entry Fee")
-    if not entry_fee:
-        entry_fee = _grab_value_after_label(lines, "Entry fee:")
-    if not entry_fee:
-        entry_fee = _grab_value_after_label(lines, "Entry fee")
-
-    sections_raw = _grab_value_after_label(lines, "Sections:")
-    if not sections_raw:
-        sections_raw = _grab_value_after_label(lines, "Sections")
-
     # Description (optional)
-    description = ""
-    # grab first ~250 lines into a readable blob, but keep it short
-    description = re.sub(r"\s+", " ", " ".join(lines[:250])).strip()[:900]
+    # grab first ~250 lines into a readable blob, but keep it short; lines are already
+    # whitespace-collapsed, so only join as many as the 900-char cap needs
+    desc_lines: list[str] = []
+    size = 0
+    for ln in lines[:250]:
+        desc_lines.append(ln)
+        size += len(ln) + 1
+        if size > 900:
+            break
 
-    event["venue"] = venue or event.get("venue", "")
-    event["timeControl"] = time_control or event.get("timeControl", "")
-    event["entryFee"] = entry_fee or event.get("entryFee", "")
-    event["sections"] = _parse_sections(sections_raw) or event.get("sections", [])
-    event["description"] = description or event.get("description", "")
+    return {
+        "venue": venue,
+        "timeControl": values["Time Control"],
+        "entryFee": values["Entry Fee"],
+        "sections": _parse_sections(values["Sections"]),
+        "description": " ".join(desc_lines)[:900],
+    }
 
+def enrich_uschess_event(event: dict[str, Any], details: dict[str, Any]) -> dict[str, Any]:
+    for field in USCHESS_ENRICHED_FIELDS:
+        event[field] = details.get(field) or event.get(field, "")
     return event
 
 
@@ -377,70 +661,67 @@ MONTHS_ABBR = {
 }
 
 def _michess_extract_detail_urls_from_events(listing_html: str, base_url: str) -> list[str]:
-    urls: set[str] = set()
-    for href in re.findall(r'href=["\'](/event-details/[^"\']+)["\']', listing_html, flags=re.I):
-        urls.add(urljoin(base_url, href))
-    for href in re.findall(r'href=["\'](https?://www\.michess\.org/event-details/[^"\']+)["\']', listing_html, flags=re.I):
-        urls.add(href)
-    for path in re.findall(r'(/event-details/[a-z0-9\-]+-\d+)', listing_html, flags=re.I):
-        urls.add(urljoin(base_url, path))
-    return sorted(urls)
+    # relative matches always start with "/event-details/", so prefixing the origin
+    # is what urljoin would do, without re-parsing base_url per match
+    base = urlsplit(base_url)
+    origin = f"{base.scheme}://{base.netloc}"
+    # dict.fromkeys dedupes while keeping listing order
+    urls: dict[str, None] = {}
+    for m in _RE_MICHESS_DETAIL.finditer(listing_html):
+        absolute = m.group("abs")
+        urls[absolute if absolute else origin + (m.group("rel") or m.group("path"))] = None
+    return list(urls)
 
 def _michess_extract_detail_urls_from_sitemap(sitemap_xml: str) -> list[str]:
-    urls: set[str] = set()
-    for loc in re.findall(r"<loc>\s*(https?://www\.michess\.org/event-details/[^<\s]+)\s*</loc>", sitemap_xml, flags=re.I):
-        urls.add(loc.strip())
-    return sorted(urls)
+    return list(dict.fromkeys(loc.strip() for loc in _RE_SITEMAP_LOC.findall(sitemap_xml)))
 
 def _infer_year_from_text(text: str) -> int:
-    m = re.search(r"\b(20\d{2})\b", text)
+    m = _RE_YEAR.search(text)
     if m:
         return int(m.group(1))
     return date.today().year
 
-def _parse_michess_date_range(line: str, year_hint_text: str):
-    s = line.strip()
-    m = re.match(
-        r"^[A-Za-z]{3},\s*([A-Za-z]{3})\s*(\d{1,2})\s*-\s*[A-Za-z]{3},\s*([A-Za-z]{3})\s*(\d{1,2})$",
-        s
-    )
-    if not m:
-        return None
-
-    mon1 = MONTHS_ABBR.get(m.group(1).lower())
-    mon2 = MONTHS_ABBR.get(m.group(3).lower())
-    if not mon1 or not mon2:
-        return None
+def _parse_michess_date_range(lines: list[str], year_hint_text: str):
+    """
+    First line reading like "Sat, Mar 14 - Sun, Mar 15" that is a valid date range.
+    Searches the newline-joined lines in one go rather than matching line by line.
+    """
+    for m in _RE_MICHESS_DATE.finditer("\n".join(lines)):
+        mon1 = MONTHS_ABBR.get(m.group(1).lower())
+        mon2 = MONTHS_ABBR.get(m.group(3).lower())
+        if not mon1 or not mon2:
+            continue
 
-    d1 = int(m.group(2))
-    d2 = int(m.group(4))
-    y = _infer_year_from_text(year_hint_text)
+        d1 = int(m.group(2))
+        d2 = int(m.group(4))
+        y = _infer_year_from_text(year_hint_text)
 
-    try:
-        start = date(y, mon1, d1)
-        end = date(y, mon2, d2)
+        try:
+            start = date(y, mon1, d1)
+            end = date(y, mon2, d2)
+        except ValueError:
+            continue
         if end < start:
             end = start
         return start.isoformat(), end.isoformat()
-    except ValueError:
-        return None
+    return None
 
 def _extract_meta_title(detail_html: str) -> str:
-    m = re.search(r'property=["\']og:title["\']\s+content=["\']([^"\']+)["\']', detail_html, flags=re.I)
+    m = _RE_OG_TITLE.search(detail_html)
     if m:
         return html.unescape(m.group(1)).strip()
 
-    m2 = re.search(r"<title>\s*(.*?)\s*</title>", detail_html, flags=re.I | re.S)
+    m2 = _RE_TITLE.search(detail_html)
     if m2:
-        t = re.sub(r"<[^>]+>", " ", m2.group(1))
-        t = html.unescape(re.sub(r"\s+", " ", t)).strip()
-        t = re.split(r"\s+\|\s+", t)[0].strip()
+        t = _RE_TAG.sub(" ", m2.group(1))
+        t = html.unescape(" ".join(t.split())).strip()
+        t = _RE_TITLE_SUFFIX.split(t)[0].strip()
         return t
 
-    m3 = re.search(r"<h1[^>]*>\s*(.*?)\s*</h1>", detail_html, flags=re.I | re.S)
+    m3 = _RE_H1.search(detail_html)
     if m3:
-        t = re.sub(r"<[^>]+>", " ", m3.group(1))
-        return html.unescape(re.sub(r"\s+", " ", t)).strip()
+        t = _RE_TAG.sub(" ", m3.group(1))
+        return html.unescape(" ".join(t.split())).strip()
 
     return ""
 
@@ -451,47 +732,36 @@ def parse_michess_event_detail(detail_html: str, source: dict[str, Any], url: st
 
     lines = _strip_html_to_lines(detail_html)
 
-    startDate = endDate = None
     year_hint = " ".join([title] + lines[:100])
-    for ln in lines[:250]:
-        dr = _parse_michess_date_range(ln, year_hint)
-        if dr:
-            startDate, endDate = dr
-            break
-    if not startDate:
+    dr = _parse_michess_date_range(lines[:250], year_hint)
+    if not dr:
         return None
+    startDate, endDate = dr
 
     venue_line = ""
     city = "Unknown"
     state = "US"
 
     for ln in lines[:600]:
-        mloc = re.search(r"\b([A-Za-z .'-]+),\s*([A-Z]{2})\b", ln)
+        # "City, ST" needs a comma; most lines have none and the regex is slow to reject them
+        if "," not in ln:
+            continue
+        mloc = _RE_CITY_STATE.search(ln)
         if not mloc:
             continue
-        looks_addressy = bool(re.search(r"\d{2,}|\bUnited States\b|\b\d{5}\b", ln))
+        looks_addressy = bool(_RE_ADDRESSY.search(ln))
         if looks_addressy or not venue_line:
-            venue_line = ln.strip()
+            venue_line = ln
             city = mloc.group(1).strip()
-            state = mloc.group(2).strip()
+            state = mloc.group(2)
             if looks_addressy:
                 break
 
-    fmt = _grab_value_after_label(lines, "Format:")
-    if not fmt:
-        fmt = _grab_value_after_label(lines, "Format")
-
-    tc = _grab_value_after_label(lines, "Time Control:")
-    if not tc:
-        tc = _grab_value_after_label(lines, "Time Control")
-
-    fee = _grab_value_after_label(lines, "Entry Fee:")
-    if not fee:
-        fee = _grab_value_after_label(lines, "Entry Fee")
-
-    sections_raw = _grab_value_after_label(lines, "Sections:")
-    if not sections_raw:
-        sections_raw = _grab_value_after_label(lines, "Sections")
+    values = _extract_labeled_values(lines, ("Format", "Time Control", "Entry Fee", "Sections"))
+    fmt = values["Format"]
+    tc = values["Time Control"]
+    fee = values["Entry Fee"]
+    sections_raw = values["Sections"]
 
     return {
         "id": f"{source['id']}-{sanitize_slug(title)}-{startDate}",
@@ -506,37 +776,48 @@ def parse_michess_event_detail(detail_html: str, source: dict[str, Any], url: st
         "format": fmt,
         "entryFee": fee,
         "sections": _parse_sections(sections_raw),
-        "timeControl": re.sub(r"\s+", " ", tc).strip() if tc else "",
+        "timeControl": " ".join(tc.split()),
         "sourceId": source["id"],
         "sourceUrl": url,
     }
 
-def parse_michess_events(listing_html: str, source: dict[str, Any]) -> list[dict[str, Any]]:
+def parse_michess_events(
+    listing_html: str,
+    source: dict[str, Any],
+    cache: PageCache | None = None,
+) -> list[dict[str, Any]]:
+    cache = cache or PageCache(None)
     base = source["homepage"]
 
     urls = _michess_extract_detail_urls_from_events(listing_html, base)
-    print(f"[michess] /events contained {len(urls)} event-details urls")
+    log(f"[michess] /events contained {len(urls)} event-details urls")
 
     if not urls:
         try:
             sm = fetch_text(source["sitemap"])
             urls = _michess_extract_detail_urls_from_sitemap(sm)
-            print(f"[michess] sitemap contained {len(urls)} event-details urls")
+            log(f"[michess] sitemap contained {len(urls)} event-details urls")
         except Exception as e:
-            print(f"[michess] sitemap fetch failed: {e}")
+            log(f"[michess] sitemap fetch failed: {e}")
             urls = []
 
     urls = urls[:250]  # safety cap
 
+    # Pages without a year get dated in the current one (_infer_year_from_text), so
+    # their cached parse is only good for the year it was made in
+    year = str(date.today().year)
+
     out: list[dict[str, Any]] = []
-    for u in urls:
-        try:
-            detail_html = fetch_text(u)
-            ev = parse_michess_event_detail(detail_html, source, u)
-            if ev:
-                out.append(ev)
-        except Exception as e:
-            print(f"[michess] detail FAILED {u}: {e}")
+    # Fetch concurrently, parse in the main thread in listing order
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as pool:
+        pending = [(u, pool.submit(cache.fetch, u, year)) for u in urls]
+        for u, fut in pending:
+            try:
+                ev = cache.parse(u, fut.result(), lambda t, u=u: parse_michess_event_detail(t, source, u), year)
+                if ev:
+                    out.append(ev)
+            except Exception as e:
+                log(f"[michess] detail FAILED {u}: {e}")
 
     return out
 
@@ -545,70 +826,197 @@ def parse_michess_events(listing_html: str, source: dict[str, Any]) -> list[dict
 # Orchestrator
 # ----------------------------
 
-def fetch_source(source: dict[str, Any]) -> list[dict[str, Any]]:
-    parser = source["parser"]
-
-    if parser == "uschess_upcoming":
-        events: list[dict[str, Any]] = []
-        for page in range(0, 120):
-            url = source["endpoint"] if page == 0 else f"{source['endpoint']}?page={page}"
-            html_text = fetch_text(url)
-            page_events = parse_uschess_upcoming(html_text, source)
-            print(f"[uschess-upcoming] page={page} parsed={len(page_events)}")
-            if not page_events and page > 0:
+def _fetch_uschess(
+    source: dict[str, Any],
+    cache: PageCache,
+    today: str,
+) -> list[dict[str, Any]]:
+    events: list[dict[str, Any]] = []
+
+    def page_url(page: int) -> str:
+        return source["endpoint"] if page == 0 else f"{source['endpoint']}?page={page}"
+
+    def fetch_page(page: int) -> tuple[str | None, dict[str, str]]:
+        # one retry for transient failures; a 404 is an answer, not a hiccup
+        try:
+            return cache.fetch(page_url(page))
+        except FetchError as e:
+            if e.status == 404:
+                raise
+        return cache.fetch(page_url(page))
+
+    def parse_page(page: int, response: tuple[str | None, dict[str, str]]) -> list[dict[str, Any]]:
+        return cache.parse(page_url(page), response, lambda t: parse_uschess_upcoming(t, source))
+
+    # Out-of-range pages may repeat the last real page rather than come back empty,
+    # so a page that adds no new sourceUrl ends pagination too
+    seen_urls: set[str] = set()
+
+    def add_new(page_events: list[dict[str, Any]]) -> int:
+        added = 0
+        for e in page_events:
+            if e["sourceUrl"] not in seen_urls:
+                seen_urls.add(e["sourceUrl"])
+                events.append(e)
+                added += 1
+        return added
+
+    # Page 0 also tells us the pager's last page, when it has one
+    page_events, last_page = cache.parse(
+        page_url(0),
+        cache.fetch(page_url(0)),
+        lambda t: [parse_uschess_upcoming(t, source), _uschess_last_page(t)],
+    )
+    log(f"[uschess-upcoming] page=0 parsed={len(page_events)} last_page={last_page}")
+    add_new(page_events)
+
+    # The highest page linked from page 0 sizes the first fan-out; pagers that only link
+    # "next" or a window of pages can go further, so probe the page after it and go back
+    # to speculative batches only if that adds events. Either way, stop at the first page
+    # with no new events.
+    batch_size = USCHESS_PAGE_BATCH if last_page is None else max(last_page, 1)
+
+    page = 1
+    with ThreadPoolExecutor(max_workers=USCHESS_PAGE_BATCH) as pool:
+        while page < USCHESS_MAX_PAGES:
+            batch = range(page, min(page + batch_size, USCHESS_MAX_PAGES))
+            batch_size = 1 if last_page is not None and batch.stop == last_page + 1 else USCHESS_PAGE_BATCH
+            pending = [(p, pool.submit(fetch_page, p)) for p in batch]
+            done = False
+            failure: tuple[int, Exception] | None = None
+            for p, fut in pending:
+                if done:
+                    fut.cancel()
+                    continue
+                try:
+                    page_events = parse_page(p, fut.result())
+                except Exception as e:
+                    done = True
+                    # Only a 404 past the pager's range is the end of the listing; anything
+                    # else would publish a silently truncated feed
+                    if isinstance(e, FetchError) and e.status == 404 and (last_page is None or p > last_page):
+                        log(f"[uschess-upcoming] page={p} not found, end of listing")
+                    else:
+                        failure = (p, e)
+                    continue
+                log(f"[uschess-upcoming] page={p} parsed={len(page_events)}")
+                if not add_new(page_events):
+                    done = True
+            if failure:
+                p, e = failure
+                raise RuntimeError(f"US Chess listing page {p} failed: {e}") from e
+            if done:
                 break
-            events.extend(page_events)
+            page = batch.stop
+
+    # Drop past events before enrichment to avoid wasted fetches; events are unique by
+    # sourceUrl already
+    unique = [e for e in events if is_upcoming(e, today)]
+    log(f"[uschess-upcoming] unique events before enrichment: {len(unique)}")
+
+    # Enrich a reasonable cap (prevents Actions from running forever); if there are more
+    # than cap, the rest are included un-enriched (still useful)
+    cap = 200
+    to_enrich = unique[:cap]
+
+    # Fetch concurrently, parse in the main thread; detail pages go through the cache
+    # like listing pages, so unchanged ones cost a 304 and no parsing. Events are
+    # filled in place, so `unique` keeps its order.
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as pool:
+        pending = [(e, pool.submit(cache.fetch, e["sourceUrl"])) for e in to_enrich]
+        for n, (e, fut) in enumerate(pending, 1):
+            if n % 20 == 0:
+                log(f"[uschess-upcoming] enriching {n}/{len(to_enrich)} ...")
+            try:
+                details = cache.parse(e["sourceUrl"], fut.result(), parse_uschess_event_detail)
+            except Exception as ex:
+                log(f"[uschess-upcoming] detail FAILED {e['sourceUrl']}: {ex}")
+                continue
+            enrich_uschess_event(e, details)
 
-        # Deduplicate by sourceUrl before enrichment to avoid double-fetches
-        by_url: dict[str, dict[str, Any]] = {}
-        for e in events:
-            by_url[e["sourceUrl"]] = e
+    log(f"[uschess-upcoming] enriched {len(to_enrich)}, left {len(unique) - len(to_enrich)} un-enriched")
+    return unique
 
-        unique = list(by_url.values())
-        print(f"[uschess-upcoming] unique events before enrichment: {len(unique)}")
 
-        # Enrich a reasonable cap (prevents Actions from running forever)
-        cap = 200
-        enriched: list[dict[str, Any]] = []
-        for idx, e in enumerate(unique[:cap], start=1):
-            if idx % 20 == 0:
-                print(f"[uschess-upcoming] enriching {idx}/{min(cap, len(unique))} ...")
-            enriched.append(enrich_uschess_event(e))
+def _fetch_michess(
+    source: dict[str, Any],
+    cache: PageCache,
+    today: str,
+) -> list[dict[str, Any]]:
+    listing_html = fetch_text(source["endpoint"])
+    return [e for e in parse_michess_events(listing_html, source, cache) if is_upcoming(e, today)]
 
-        # If there were more than cap, include the rest un-enriched (still useful)
-        if len(unique) > cap:
-            enriched.extend(unique[cap:])
 
-        return enriched
+SourceFetcher = Callable[
+    [dict[str, Any], PageCache, str],
+    list[dict[str, Any]],
+]
+
+# SOURCE_CATALOG "parser" -> fetcher
+PARSERS: dict[str, SourceFetcher] = {
+    "uschess_upcoming": _fetch_uschess,
+    "michess_events": _fetch_michess,
+}
 
-    if parser == "michess_events":
-        listing_html = fetch_text(source["endpoint"])
-        return parse_michess_events(listing_html, source)
 
-    return []
+def fetch_source(
+    source: dict[str, Any],
+    cache: PageCache | None = None,
+    today: str | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Upcoming events (ending today or later) from one SOURCE_CATALOG entry.
+    """
+    fetcher = PARSERS.get(source["parser"])
+    if fetcher is None:
+        return []
+    return fetcher(source, cache or PageCache(None), today or date.today().isoformat())
 
 
 def main() -> None:
     all_events: list[dict[str, Any]] = []
+    published = read_published_events()
+    cache = PageCache()
+    today = date.today().isoformat()
 
-    for source in SOURCE_CATALOG:
-        try:
-            events = fetch_source(source)
-            print(f"[{source['id']}] fetched {len(events)} raw events")
-            all_events.extend(events)
-        except Exception as e:
-            print(f"[{source['id']}] FAILED: {e}")
+    # Sources live on different hosts, so fetch them side by side; results are
+    # still collected in SOURCE_CATALOG order
+    with ThreadPoolExecutor(max_workers=len(SOURCE_CATALOG)) as pool:
+        pending = [(source, pool.submit(fetch_source, source, cache, today)) for source in SOURCE_CATALOG]
+        for source, fut in pending:
+            try:
+                events = fut.result()
+                log(f"[{source['id']}] fetched {len(events)} upcoming events")
+                all_events.extend(events)
+            except Exception as e:
+                # Keep the source's last published events rather than dropping them from the feed
+                kept = [ev for ev in published if ev.get("sourceId") == source["id"] and is_upcoming(ev, today)]
+                log(f"[{source['id']}] FAILED: {e}; keeping {len(kept)} previously published events")
+                all_events.extend(kept)
 
-    all_events = [e for e in all_events if is_upcoming(e)]
     all_events = dedupe(all_events)
 
-    payload = {
-        "syncedAt": datetime.now(timezone.utc).isoformat(),
-        "events": all_events,
-    }
-
-    OUTPUT_PATH.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    print(f"Wrote {OUTPUT_PATH} with {len(all_events)} events")
+    # Leave the feed (and its syncedAt) untouched when no event changed, so the daily
+    # workflow has nothing to commit; syncedAt is when the events last changed, and
+    # app.js times its cache from its own fetch
+    if all_events == published:
+        log(f"{OUTPUT_PATH} unchanged ({len(all_events)} events); not rewriting")
+    else:
+        payload = {
+            "syncedAt": datetime.now(timezone.utc).isoformat(),
+            "events": all_events,
+        }
+
+        # Write next to the feed and rename over it, so a crash mid-dump can't leave a
+        # truncated events.json behind
+        tmp_path = OUTPUT_PATH.with_name(OUTPUT_PATH.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as fp:
+            json.dump(payload, fp, indent=2)
+        tmp_path.replace(OUTPUT_PATH)
+        log(f"Wrote {OUTPUT_PATH} with {len(all_events)} events")
+
+    cache.save()
+    log(f"Parse cache: {cache.hits}/{len(cache.used)} pages unchanged since last run")
 
 
 if __name__ == "__main__":